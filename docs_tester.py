@@ -1,58 +1,119 @@
 import os
 import re
 import subprocess
+import sys
 import datetime
-import textwrap
+import itertools
 from pathlib import Path
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
 # Folders and files
 DOCS_FOLDER = "docs"         # Folder containing .mdx files
 OUTPUT_DIR = "temp_code"     # Folder to output generated code files
 REPORT_FILE = "report.txt"   # File to write execution report
 
-# Mapping of languages to file extension and execution command
+# Maximum number of generated files executed at once across the whole run
+EXEC_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Worker processes for MDX files; each runs at most EXEC_WORKERS_PER_PROCESS files at once,
+# so the run as a whole never exceeds EXEC_WORKERS
+PROCESS_WORKERS = min(os.cpu_count() or 1, EXEC_WORKERS)
+EXEC_WORKERS_PER_PROCESS = EXEC_WORKERS // PROCESS_WORKERS
+
+# Mapping of languages to file extension, execution command and timeout (seconds, None for no limit)
 LANGUAGE_CONFIG = {
-    "python": {"ext": ".py", "exec_cmd": ["python"]},
-    "javascript": {"ext": ".js", "exec_cmd": ["node"]},
-    "bash": {"ext": ".sh", "exec_cmd": ["bash"]},
+    "python": {"ext": ".py", "exec_cmd": ["python"], "timeout": 30},
+    "javascript": {"ext": ".js", "exec_cmd": ["node"], "timeout": 30},
+    "bash": {"ext": ".sh", "exec_cmd": ["bash"], "timeout": None},
 }
 
+# Precompiled patterns for parsing MDX content
+_STEP_RE = re.compile(r"<Step\b([^>]*)>(.*?)</Step>", re.DOTALL)
+_TABS_RE = re.compile(r"<Tabs>(.*?)</Tabs>", re.DOTALL)
+_TAB_RE = re.compile(r"<Tab\b([^>]*)>(.*?)</Tab>", re.DOTALL)
+_TITLE_RE = re.compile(r'title\s*=\s*"([^"]+)"')
+
+# Delimiter that opens and closes a fenced code block
+FENCE = "```"
+
 #Identify MDX Files with <Steps> Tags
 
-def find_mdx_files_with_steps(root_folder):
+def iter_mdx_paths(folder):
     """
-    Recursively search for .mdx files in 'root_folder' that contain a <Steps> block.
+    Recursively yield the paths of .mdx files under 'folder' using os.scandir.
     
-    Returns:
-        List of file paths.
+    Args:
+        folder (str): Directory to search.
+    
+    Yields:
+        File paths.
     """
-    mdx_files = []
-    for dirpath, _, filenames in os.walk(root_folder):
-        for fname in filenames:
-            if fname.endswith(".mdx"):
-                path = os.path.join(dirpath, fname)
+    files = []
+    subdirs = []
+    # Errors are handled as os.walk does: a folder that cannot be opened or
+    # listed is skipped entirely, and an entry that cannot be stat'ed is
+    # treated as neither a directory nor a symlink.
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+    with entries:
+        while True:
+            try:
+                entry = next(entries)
+            except StopIteration:
+                break
+            except OSError:
+                return
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    if "<Steps>" in content and "</Steps>" in content:
-                        mdx_files.append(path)
-                except Exception as e:
-                    print(f"Error reading {path}: {e}")
-    return mdx_files
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                # Like os.walk, do not descend into symlinked directories.
+                if not is_symlink:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".mdx"):
+                files.append(entry.path)
+    # Yield this folder's files before descending, matching os.walk's top-down order.
+    yield from files
+    for subdir in subdirs:
+        yield from iter_mdx_paths(subdir)
 
-def extract_steps_section(content):
+def read_steps_file(path):
     """
-    Extract the content within the first <Steps> ... </Steps> block.
+    Read an .mdx file and locate its first <Steps> block.
+    
+    The file is read as bytes and is only decoded (replacing invalid UTF-8,
+    with line endings normalised to "\n") if it contains both "<Steps>" and "</Steps>".
     
     Args:
-        content (str): The full MDX file content.
+        path (str): Path to the .mdx file.
     
     Returns:
-        The content inside the <Steps> block (or an empty string if not found).
+        Tuple of (file content, steps_start, steps_end), where
+        content[steps_start:steps_end] is the inside of the first <Steps> block
+        and steps_end is -1 if no </Steps> follows it.
+        None if the file has no <Steps> block or cannot be read.
     """
-    match = re.search(r"<Steps>(.*?)</Steps>", content, re.DOTALL)
-    return match.group(1) if match else ""
+    try:
+        data = Path(path).read_bytes()
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return None
+    # Check the raw bytes first so files without Steps are never decoded.
+    if b"<Steps>" not in data or b"</Steps>" not in data:
+        return None
+    # Normalise line endings as text-mode open() does, so CRLF files parse and dedent correctly.
+    content = data.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+    steps_start = content.find("<Steps>") + len("<Steps>")
+    steps_end = content.find("</Steps>", steps_start)
+    return content, steps_start, steps_end
 
 #Parsing Each <Step> Block
 
@@ -66,44 +127,131 @@ def extract_steps(steps_content):
       - "tabs": dict mapping tab title to dict of language to list of code snippets (from code blocks inside <Tab>).
     
     Returns:
-        List of step dictionaries.
+        Tuple of (list of step dictionaries, set of all languages used in the steps).
     """
     steps = []
-    step_pattern = re.compile(r"<Step\b([^>]*)>(.*?)</Step>", re.DOTALL)
-    for step_match in step_pattern.finditer(steps_content):
+    all_langs = set()
+    for step_match in _STEP_RE.finditer(steps_content):
         step_attrs = step_match.group(1)
         step_body = step_match.group(2)
         # Extract step title 
-        title_match = re.search(r'title\s*=\s*"([^"]+)"', step_attrs)
-        step_title = title_match.group(1) if title_match else "untitled_step"
+        title_match = _TITLE_RE.search(step_attrs)
+        step_title = sys.intern(title_match.group(1)) if title_match else "untitled_step"
         
         # Step dictionary
         step_dict = {"title": step_title, "common_code": {}, "tabs": {}}
         
         # Check if step has <Tabs>
-        tabs_match = re.search(r"<Tabs>(.*?)</Tabs>", step_body, re.DOTALL)
+        tabs_match = _TABS_RE.search(step_body)
         if tabs_match:
             tabs_content = tabs_match.group(1)
             # Code outside the <Tabs> block is considered common code.
-            outside_body = step_body.replace(tabs_match.group(0), "")
-            extract_code_blocks_into(outside_body, step_dict["common_code"])
+            outside_body = step_body[:tabs_match.start()] + step_body[tabs_match.end():]
+            extract_code_blocks_into(outside_body, step_dict["common_code"], all_langs)
             # Process each <Tab>
-            tab_pattern = re.compile(r"<Tab\b([^>]*)>(.*?)</Tab>", re.DOTALL)
-            for tmatch in tab_pattern.finditer(tabs_content):
+            for tmatch in _TAB_RE.finditer(tabs_content):
                 tab_attrs = tmatch.group(1)
                 tab_body = tmatch.group(2)
-                tab_title_match = re.search(r'title\s*=\s*"([^"]+)"', tab_attrs)
-                tab_title = tab_title_match.group(1) if tab_title_match else "untitled_tab"
+                tab_title_match = _TITLE_RE.search(tab_attrs)
+                # Tab titles are reused as dict keys across steps, so intern them.
+                tab_title = sys.intern(tab_title_match.group(1)) if tab_title_match else "untitled_tab"
                 step_dict["tabs"].setdefault(tab_title, {})
-                extract_code_blocks_into(tab_body, step_dict["tabs"][tab_title])
+                extract_code_blocks_into(tab_body, step_dict["tabs"][tab_title], all_langs)
         else:
             # No <Tabs>: all code in the step is common.
-            extract_code_blocks_into(step_body, step_dict["common_code"])
+            extract_code_blocks_into(step_body, step_dict["common_code"], all_langs)
         
         steps.append(step_dict)
-    return steps
+    return steps, all_langs
+
+def find_fence(text, pos):
+    """
+    Find the next code fence that starts a line (ignoring indentation).
+    
+    Args:
+        text (str): The text to search.
+        pos (int): Index to start searching from; the fence's line must start at or after it.
+    
+    Returns:
+        Index of the fence, or -1 if there is none.
+    """
+    while True:
+        idx = text.find(FENCE, pos)
+        if idx < 0:
+            return -1
+        # Walk back over indentation only, so long lines are not rescanned per fence.
+        line_start = idx
+        while line_start > pos and text[line_start - 1] != "\n" and text[line_start - 1].isspace():
+            line_start -= 1
+        if line_start == 0 or text[line_start - 1] == "\n":
+            return idx
+        pos = idx + len(FENCE)
+
+def iter_code_blocks(text):
+    """
+    Scan the text once and yield each fenced code block.
+    
+    Uses str.find rather than a lazy DOTALL regex so that large files
+    with many fences are scanned in linear time.
+    
+    Args:
+        text (str): The text to search.
+    
+    Yields:
+        Tuples of (lang, body) where lang is the raw language label ("" if absent)
+        and body is the block content before dedenting.
+    """
+    pos = 0
+    while True:
+        start = find_fence(text, pos)
+        if start < 0:
+            return
+        newline = text.find("\n", start + len(FENCE))
+        if newline < 0:
+            return
+        end = find_fence(text, newline + 1)
+        if end < 0:
+            return
+        lang_end = start + len(FENCE)
+        while lang_end < newline and (text[lang_end].isalnum() or text[lang_end] in "_+-"):
+            lang_end += 1
+        body_end = text.rfind("\n", 0, end) + 1
+        yield text[start + len(FENCE):lang_end], text[newline + 1:body_end]
+        pos = end + len(FENCE)
+
+def fast_dedent(code):
+    """
+    Remove common leading whitespace from a code block and strip it.
+    
+    Equivalent to textwrap.dedent(code).strip(), but works on the split lines
+    directly instead of running textwrap's regexes over the whole block.
+    
+    Args:
+        code (str): The code block body.
+    
+    Returns:
+        The dedented, stripped code.
+    """
+    lines = code.split("\n")
+    margin = None
+    for line in lines:
+        content = line.lstrip(" \t")
+        if not content:
+            # Whitespace-only lines do not affect the margin.
+            continue
+        indent = line[:len(line) - len(content)]
+        if margin is None or margin.startswith(indent):
+            margin = indent
+        elif not indent.startswith(margin):
+            # Shrink the margin to the prefix it shares with this indent.
+            common = 0
+            while margin[common] == indent[common]:
+                common += 1
+            margin = margin[:common]
+    width = len(margin) if margin else 0
+    return "\n".join(line[width:] if line.lstrip(" \t") else "" for line in lines).strip()
 
-def extract_code_blocks_into(text, code_map):
+def extract_code_blocks_into(text, code_map, langs_out=None):
     """
     Extract code blocks in the given text and add them to code_map.
     
@@ -116,17 +264,18 @@ def extract_code_blocks_into(text, code_map):
     Args:
         text (str): The text to search.
         code_map (dict): Dictionary mapping language to list of code snippets.
+        langs_out (set, optional): If given, every language added to code_map is also added here.
     """
-    code_block_pattern = re.compile(r"(?m)^\s*```([\w+-]+)?[^\n]*\n(.*?)^\s*```", re.DOTALL)
-    for match in code_block_pattern.finditer(text):
-        lang = match.group(1)
-        code = textwrap.dedent(match.group(2)).strip()
+    for lang, body in iter_code_blocks(text):
         if not lang:
             # Skip code blocks without a language label.
             continue
-        lang = lang.lower()
+        lang = sys.intern(lang.lower())
+        # Only dedent blocks in a supported language; the rest are discarded.
         if lang in LANGUAGE_CONFIG:
-            code_map.setdefault(lang, []).append(code)
+            code_map.setdefault(lang, []).append(fast_dedent(body))
+            if langs_out is not None:
+                langs_out.add(lang)
 
 #Build Workflow Branches by Matching Tab Names
 
@@ -148,7 +297,14 @@ def build_branches_for_language(steps, lang):
         Dict mapping branch name (str) to the combined code (str).
         The default branch (no specific tab) is represented by an empty string.
     """
-    current = {"": ""}  # Start with a default "common" branch.
+    # Fast path: without tabs for 'lang' there is only the common branch.
+    has_tabs = any(lang in tab_langs for step in steps for tab_langs in step["tabs"].values())
+    if not has_tabs:
+        step_codes = ("\n\n".join(step["common_code"].get(lang, [])).strip() for step in steps)
+        return {"": "\n\n".join(filter(None, step_codes)).strip()}
+    
+    # Each branch is kept as a list of code fragments and joined once at the end.
+    current = {"": []}  # Start with a default "common" branch.
     
     for step in steps:
         common_list = step["common_code"].get(lang, [])
@@ -165,68 +321,59 @@ def build_branches_for_language(steps, lang):
         if not valid_tabs:
             # No tabs for this step: append common code to all current branches.
             if combined_common:
-                for branch in current:
-                    current[branch] = (current[branch] + "\n\n" + combined_common).strip()
+                for fragments in current.values():
+                    fragments.append(combined_common)
             continue
         
         # Step has valid tabs: first, append common code to all branches.
         if combined_common:
-            for branch in current:
-                current[branch] = (current[branch] + "\n\n" + combined_common).strip()
+            for fragments in current.values():
+                fragments.append(combined_common)
         
         # Then process tabs: unify branches by tab name.
-        new_branches = {}
-        used_tab_titles = set()
-        for branch, code_so_far in current.items():
-            for ttitle, tcode in valid_tabs.items():
-                if ttitle == branch:
-                    # Matching branch: append tab code.
-                    new_branches[ttitle] = (code_so_far + "\n\n" + tcode).strip()
-                    used_tab_titles.add(ttitle)
-                elif branch == "":
-                    # Default branch: create a new branch with this tab title.
-                    new_branches[ttitle] = (code_so_far + ("\n\n" + tcode if tcode else "")).strip()
-                    used_tab_titles.add(ttitle)
-                else:
-                    # Retain existing branch if not overwritten.
-                    if branch not in new_branches:
-                        new_branches[branch] = code_so_far
+        if "" in current:
+            # Only the default branch exists until the first tabbed step:
+            # split it into one branch per tab.
+            default = current[""]
+            current = {ttitle: default + [tcode] for ttitle, tcode in valid_tabs.items()}
+            continue
+        # Matching branches get the tab's code; other branches carry forward unchanged.
+        for branch, fragments in current.items():
+            if branch in valid_tabs:
+                fragments.append(valid_tabs[branch])
         # For any tab not yet represented, create a new branch.
         for ttitle, tcode in valid_tabs.items():
-            if ttitle not in used_tab_titles:
-                new_branches[ttitle] = (combined_common + "\n\n" + tcode).strip() if combined_common else tcode
-        current = new_branches
-    
-    # Trim whitespace in all branches.
-    for key in current:
-        current[key] = current[key].strip()
-    return current
+            if ttitle not in current:
+                current[ttitle] = [combined_common, tcode]
+    
+    # Join each branch's non-empty fragments and trim whitespace.
+    return {branch: "\n\n".join(filter(None, fragments)).strip() for branch, fragments in current.items()}
 
 #Execute Code Files
-def execute_code_file(file_path, lang):
+def execute_code_file(file_path, exec_cmd, timeout):
     """
-    Execute the generated code file for the given language and capture its output.
+    Execute the generated code file with the given command and capture its output.
     
     Args:
         file_path (str): Path to the generated file.
-        lang (str): The language (must be in LANGUAGE_CONFIG).
+        exec_cmd (list): The language's execution command (from LANGUAGE_CONFIG).
+        timeout (int or None): Seconds to wait before giving up, or None for no limit.
     
     Returns:
         Dict with keys "output", "error", and "exit_code".
     """
-    config = LANGUAGE_CONFIG[lang]
-    cmd = config["exec_cmd"] + [file_path]
-    timeout = None if lang == "bash" else 30
+    cmd = exec_cmd + [file_path]
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        # Capture raw bytes and decode once, rather than through a text-mode wrapper.
+        proc = subprocess.run(cmd, capture_output=True, timeout=timeout)
         return {
-            "output": proc.stdout.strip(),
-            "error": proc.stderr.strip(),
+            "output": proc.stdout.decode("utf-8", "replace").strip() if proc.stdout else "",
+            "error": proc.stderr.decode("utf-8", "replace").strip() if proc.stderr else "",
             "exit_code": proc.returncode
         }
     except subprocess.TimeoutExpired as e:
         return {
-            "output": e.stdout or "",
+            "output": e.stdout.decode("utf-8", "replace").strip() if e.stdout else "",
             "error": f"Command timed out: {e}",
             "exit_code": -1
         }
@@ -234,6 +381,116 @@ def execute_code_file(file_path, lang):
         return {"output": "", "error": str(e), "exit_code": -1}
 
 
+#Process a Single MDX File
+
+def process_mdx(mdx_file, file_index, extract_only, run_ts):
+    """
+    Generate (and optionally execute) the code files for one MDX file.
+    
+    Runs in a worker process, so output is collected rather than printed.
+    The file is read here, so each worker only holds its own file in memory.
+    
+    Args:
+        mdx_file (str): Path to the MDX file.
+        file_index (int): Position of the file in this run, used to keep generated file names unique.
+        extract_only (bool): If True, only generate code files; do not execute them.
+        run_ts (str): Timestamp of the current run, used in generated file names.
+    
+    Returns:
+        List of report lines for this file, or None if it has no <Steps> block.
+    """
+    steps_file = read_steps_file(mdx_file)
+    if steps_file is None:
+        return None
+    content, steps_start, steps_end = steps_file
+    report_lines = [f"Processing: {mdx_file}"]
+    
+    steps_block = content[steps_start:steps_end] if steps_end >= 0 else ""
+    if not steps_block:
+        report_lines.append("  No <Steps> section found; skipping.")
+        return report_lines
+    
+    steps, all_langs = extract_steps(steps_block)
+    if not steps:
+        report_lines.append("  No steps found after parsing.")
+        return report_lines
+    
+    base_name = Path(mdx_file).stem
+    # Numbers generated files within this MDX file; with file_index, names stay unique across the run.
+    file_seq = itertools.count()
+    
+    # For each language, build the workflow branches and write them out.
+    generated = []  # (lang, [(branch_name, out_path, skip_reason), ...]) in generation order
+    jobs = []  # (out_path, exec_cmd, timeout) for each generated file
+    for lang in all_langs:
+        lang_cfg = LANGUAGE_CONFIG[lang]
+        ext = lang_cfg["ext"]
+        exec_cmd = lang_cfg["exec_cmd"]
+        timeout = lang_cfg["timeout"]
+        branch_map = build_branches_for_language(steps, lang)
+        # branch_map is a dict { branch_name: final_code }
+        lang_files = []
+        seen = {}  # final_code -> name of the first branch that produced it
+        for branch_name, final_code in branch_map.items():
+            # Skip empty branches and branches identical to one already generated,
+            # but keep a note so the report still shows the branch was covered.
+            if not final_code:
+                lang_files.append((branch_name, None, "no code"))
+                continue
+            if final_code in seen:
+                lang_files.append((branch_name, None, f"identical to {seen[final_code] or 'common'}"))
+                continue
+            seen[final_code] = branch_name
+            seq = next(file_seq)
+            if branch_name:
+                out_file = f"{base_name}_{branch_name}_{run_ts}_{file_index:04d}-{seq:04d}{ext}"
+            else:
+                out_file = f"{base_name}_{run_ts}_{file_index:04d}-{seq:04d}{ext}"
+            out_path = os.path.join(OUTPUT_DIR, out_file)
+            
+            with open(out_path, "w", encoding="utf-8") as wf:
+                wf.write(final_code)
+            lang_files.append((branch_name, out_path, None))
+            jobs.append((out_path, exec_cmd, timeout))
+        if lang_files:
+            generated.append((lang, lang_files))
+    
+    # Execute the generated files concurrently; the work is in the subprocesses, so threads suffice.
+    # This process's share of the global EXEC_WORKERS limit bounds the pool.
+    exec_results = {}
+    if not extract_only and jobs:
+        with ThreadPoolExecutor(max_workers=min(EXEC_WORKERS_PER_PROCESS, len(jobs))) as executor:
+            results = executor.map(lambda job: execute_code_file(*job), jobs)
+            exec_results = {job[0]: res for job, res in zip(jobs, results)}
+    
+    for lang, lang_files in generated:
+        for branch_name, out_path, skip_reason in lang_files:
+            if skip_reason:
+                report_lines.append(f"  (Branch {branch_name or 'common'} skipped: {skip_reason})")
+                continue
+            report_lines.append(f"File generated: {out_path} (lang={lang}, branch={branch_name or 'common'})")
+            
+            if not extract_only:
+                exec_res = exec_results[out_path]
+                emoji = "✅" if exec_res["exit_code"] == 0 else "❌"
+                report_lines.append(f"File tested: {'successful' if exec_res['exit_code'] == 0 else 'unsuccessful'} {emoji}")
+                report_lines.append("Output:")
+                if exec_res["output"]:
+                    for line in exec_res["output"].splitlines():
+                        report_lines.append("  " + line)
+                else:
+                    report_lines.append("  (No output)")
+                if exec_res["error"]:
+                    report_lines.append("Errors:")
+                    for line in exec_res["error"].splitlines():
+                        report_lines.append("  " + line)
+            else:
+                report_lines.append("  (Execution skipped via --extract_only)")
+        
+        report_lines.append("-" * 80)
+    
+    return report_lines
+
 def main():
     parser = argparse.ArgumentParser(
         description="Build code workflows from MDX <Steps> with tab-based branch unification."
@@ -242,107 +499,36 @@ def main():
                         help="Only generate code files; do not execute them.")
     args = parser.parse_args()
 
-    mdx_files = find_mdx_files_with_steps(DOCS_FOLDER)
-    report_lines = ["Code Execution Report", "=" * 80, ""]
-    
-    if not mdx_files:
-        msg = "No MDX files with <Steps> found."
-        print(msg)
-        report_lines.append(msg)
-    
-    for mdx_file in mdx_files:
-        msg = f"Processing: {mdx_file}"
-        print(msg)
-        report_lines.append(msg)
-        
-        try:
-            with open(mdx_file, "r", encoding="utf-8") as f:
-                content = f.read()
-        except Exception as e:
-            err_msg = f"  Could not read file: {e}"
-            print(err_msg)
-            report_lines.append(err_msg)
-            continue
+    run_ts = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    mdx_paths = list(iter_mdx_paths(DOCS_FOLDER))
+    
+    # Report lines are streamed to the report file as they are produced.
+    with open(REPORT_FILE, "w", encoding="utf-8") as rf:
+        def log(msg):
+            print(msg)
+            rf.write(msg)
+            rf.write("\n")
         
-        steps_block = extract_steps_section(content)
-        if not steps_block:
-            err_msg = "  No <Steps> section found; skipping."
-            print(err_msg)
-            report_lines.append(err_msg)
-            continue
+        rf.write("Code Execution Report\n" + "=" * 80 + "\n\n")
         
-        steps = extract_steps(steps_block)
-        if not steps:
-            err_msg = "  No steps found after parsing."
-            print(err_msg)
-            report_lines.append(err_msg)
-            continue
+        # Create the output folder once, before any worker writes into it.
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
         
-        # Determine all languages used in the steps.
-        all_langs = set()
-        for step in steps:
-            all_langs.update(step["common_code"].keys())
-            for tab_langs in step["tabs"].values():
-                all_langs.update(tab_langs.keys())
+        # Files are independent, so process them in parallel; map() keeps report order stable.
+        # Only paths are sent to the workers, which read and filter the files themselves.
+        found_steps = False
+        with ProcessPoolExecutor(max_workers=PROCESS_WORKERS) as executor:
+            worker = partial(process_mdx, extract_only=args.extract_only, run_ts=run_ts)
+            for file_lines in executor.map(worker, mdx_paths, range(len(mdx_paths))):
+                if file_lines is None:
+                    continue
+                found_steps = True
+                for line in file_lines:
+                    log(line)
         
-        # For each language, build the workflow branches.
-        for lang in all_langs:
-            branch_map = build_branches_for_language(steps, lang)
-            # branch_map is a dict { branch_name: final_code }
-            for branch_name, final_code in branch_map.items():
-                base_name = Path(mdx_file).stem
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-                ext = LANGUAGE_CONFIG[lang]["ext"]
-                if branch_name:
-                    out_file = f"{base_name}_{branch_name}_{timestamp}{ext}"
-                else:
-                    out_file = f"{base_name}_{timestamp}{ext}"
-                out_path = os.path.join(OUTPUT_DIR, out_file)
-                os.makedirs(OUTPUT_DIR, exist_ok=True)
-                
-                with open(out_path, "w", encoding="utf-8") as wf:
-                    wf.write(final_code)
-                
-                gen_msg = f"File generated: {out_path} (lang={lang}, branch={branch_name or 'common'})"
-                print(gen_msg)
-                report_lines.append(gen_msg)
-                
-                if not args.extract_only:
-                    exec_res = execute_code_file(out_path, lang)
-                    emoji = "✅" if exec_res["exit_code"] == 0 else "❌"
-                    status_line = f"File tested: {'successful' if exec_res['exit_code'] == 0 else 'unsuccessful'} {emoji}"
-                    print(status_line)
-                    report_lines.append(status_line)
-                    print("Output:")
-                    report_lines.append("Output:")
-                    if exec_res["output"]:
-                        for line in exec_res["output"].splitlines():
-                            l = "  " + line
-                            print(l)
-                            report_lines.append(l)
-                    else:
-                        no_out = "  (No output)"
-                        print(no_out)
-                        report_lines.append(no_out)
-                    if exec_res["error"]:
-                        print("Errors:")
-                        report_lines.append("Errors:")
-                        for line in exec_res["error"].splitlines():
-                            er = "  " + line
-                            print(er)
-                            report_lines.append(er)
-                else:
-                    skip_msg = "  (Execution skipped via --extract_only)"
-                    print(skip_msg)
-                    report_lines.append(skip_msg)
-            
-            divider = "-" * 80
-            print(divider)
-            report_lines.append(divider)
-    
-    with open(REPORT_FILE, "w", encoding="utf-8") as rf:
-        rf.write("\n".join(report_lines))
+        if not found_steps:
+            log("No MDX files with <Steps> found.")
     print(f"Report written to {REPORT_FILE}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()